@@ -4,6 +4,7 @@ import shutil
 import requests
 import subprocess
 from misc.SystemRequests import SystemRequests
+from misc.constants import DOWNLOAD_CHUNK_SIZE, YES_ANSWERS
 
 
 class Config:
@@ -51,12 +52,11 @@ class Config:
         if sunvdm_log == '':
             sunvdm_log = os.path.join(svm_downloaded_dir_path, "sunvdm.log")
 
-        subprocess.run(["powershell.exe", "-Command",
-                        "Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass"])
-        if setup_sunvdm and os.path.exists(setup_sunvdm):
-            subprocess.run(["powershell.exe", "-Command", f'Unblock-File "{setup_sunvdm}"'])
-        if teardown_sunvdm and os.path.exists(teardown_sunvdm):
-            subprocess.run(["powershell.exe", "-Command", f'Unblock-File "{teardown_sunvdm}"'])
+        ps_commands = ["Set-ExecutionPolicy -Scope Process -ExecutionPolicy Bypass"]
+        for script in (setup_sunvdm, teardown_sunvdm):
+            if script and os.path.exists(script):
+                ps_commands.append(f'Unblock-File "{script}"')
+        subprocess.run(["powershell.exe", "-NoProfile", "-Command", "; ".join(ps_commands)])
 
         if self.vdd_friendly_name == '':
             self.vdd_friendly_name = self._get_vdd_friendly_name()
@@ -106,7 +106,7 @@ class Config:
             file.write(f'global_prep_cmd = {global_prep_cmd_str}\n')
 
     def _get_vdd_friendly_name(self):
-        result = subprocess.run(["powershell.exe", "-Command", "(Get-PnpDevice", "-Class", "Display", "|", "Where-Object",
+        result = subprocess.run(["powershell.exe", "-NoProfile", "-Command", "(Get-PnpDevice", "-Class", "Display", "|", "Where-Object",
                                  "{$_.FriendlyName", "-like", "'*idd*'", "-or", "$_.FriendlyName", "-like", "'*mtt*'}).FriendlyName"], capture_output=True, text=True)
         if result.returncode != 0:
             return result.stderr
@@ -130,13 +130,13 @@ class Config:
         sunshine_settings_url = self.sr.all_configs["Sunshine"]["settings_url"]
         print("\nOpening Sunshine Settings...")
         print("\nNavigate to the Audio/Video tab to add your custom Resolutions and Frame Rates.")
-        subprocess.run(f'start {sunshine_settings_url}', shell=True)
+        os.startfile(sunshine_settings_url)
         self.sr.pause()
 
     def open_playnite(self):
         playnite_url = self.sr.all_configs["Playnite"]["url"]
         print("\nOpening Playnite...")
-        subprocess.run(f'start {playnite_url}', shell=True)
+        os.startfile(playnite_url)
         self.sr.pause()
 
 
@@ -225,17 +225,18 @@ class DownloadManager:
                 print("URL format is not supported.")
                 return ""
 
-            response = requests.get(download_url)
+            response = requests.get(download_url, stream=True)
         else:
-            response = requests.get(url)
+            response = requests.get(url, stream=True)
 
         file_path = os.path.abspath(os.path.join("tools", file_name))
 
         self.sr.is_path_contains_spaces(file_path)
 
-        with open(file_path, 'wb') as file:
+        with open(file_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as file:
             print(f"\nDownloading {file_name}")
-            file.write(response.content)
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
 
         print(f'\nFile downloaded to "{file_path}"')
 
@@ -345,12 +346,12 @@ class DownloadManager:
 
         for command in commands:
             try:
-                subprocess.run(f"powershell.exe -Command \"{command}\"", shell=True, check=True)
+                subprocess.run(["powershell.exe", "-NoProfile", "-Command", command], check=True)
             except subprocess.SubprocessError as e:
                 print(e)
 
         self.vdd_friendly_name = self._config._get_vdd_friendly_name()
-        subprocess.run(["powershell.exe", "-Command", "'Get-PnpDevice", "-FriendlyName",
+        subprocess.run(["powershell.exe", "-NoProfile", "-Command", "'Get-PnpDevice", "-FriendlyName",
                         self.vdd_friendly_name, "|", "Disable-PnpDevice", "-Confirm:", "$false'"], check=True)
 
         print("\nVirtual Display Driver Installed.")
@@ -399,8 +400,7 @@ class DownloadManager:
         if svm_downloaded_dir_path:
             destination_folder = os.path.join(
                 svm_downloaded_dir_path, "multimonitortool-x64")
-            if os.path.exists(destination_folder):
-                shutil.rmtree(destination_folder)
+            self.sr.remove_tree(destination_folder)
             print(f'\nMove "{mmt_downloaded_dir_path}" to "{destination_folder}"')
             shutil.move(mmt_downloaded_dir_path, destination_folder)
 
@@ -427,8 +427,10 @@ class DownloadManager:
         if source_file and destination_folder:
             destination_file = os.path.join(
                 destination_folder, "vsynctoggle-1.1.0-x86_64.exe")
-            if os.path.exists(destination_file):
+            try:
                 os.remove(destination_file)
+            except FileNotFoundError:
+                pass
             print(f'\nMove "{source_file}" to "{destination_file}"')
             shutil.move(source_file, destination_file)
 
@@ -478,29 +480,27 @@ class DownloadManager:
             playnitew_guide = input(
                 "\nOpen PlayNite Watcher Setup Guide ? (Y/n) ")
 
-            if playnitew_guide.strip().lower() in ['y', 'ye', 'yes', '']:
-                subprocess.run(["start", playnitew_guide_url], shell=True)
+            if playnitew_guide.strip().lower() in YES_ANSWERS:
+                os.startfile(playnitew_guide_url)
             self.sr.pause()
             return
 
         if self.config.release == '11':
             windows_settings = input(
                 "\nPlease set the default terminal to Windows Console Host. Open Windows Settings ? (Y/n) ")
-            if windows_settings.strip().lower() in ['y', 'ye', 'yes', '']:
-                subprocess.run(
-                    ["start", "ms-settings:developers"], shell=True, check=True)
+            if windows_settings.strip().lower() in YES_ANSWERS:
+                os.startfile("ms-settings:developers")
 
         sap = input("\nInstall 'Sunshine App Export' on Playnite ? (Y/n) ")
 
-        if sap.strip().lower() in ['y', 'ye', 'yes', '']:
-            subprocess.run(["start", playnitew_addon_url],
-                           shell=True, check=True)
+        if sap.strip().lower() in YES_ANSWERS:
+            os.startfile(playnitew_addon_url)
 
         playnitew_guide = input(
             "\nOpen PlayNite Watcher Setup Guide ? (Y/n) ")
 
-        if playnitew_guide.strip().lower() in ['y', 'ye', 'yes', '']:
-            subprocess.run(["start", playnitew_guide_url], shell=True)
+        if playnitew_guide.strip().lower() in YES_ANSWERS:
+            os.startfile(playnitew_guide_url)
 
         print("\nPlaynite Watcher was successfully installed.")
 
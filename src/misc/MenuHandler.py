@@ -1,6 +1,7 @@
 import json
+import os
 import sys
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 from misc.Config import DownloadManager
 from misc.SystemRequests import SystemRequests
 from . import __version__
@@ -23,46 +24,50 @@ class MenuHandler:
     def __init__(self, base_path: str) -> None:
         self._page: int = 0
         self._choices: List[Dict[str, str]]
+        self._choices_numbers: List[int]
         self._choices_number: int
         self._sr: SystemRequests = SystemRequests(base_path)
-        self._logo_menu_path: str = f"{self._sr._base_path}\\misc\\ressources\\logo_menu.txt"
-        self._menu_choices_path: str = f"{self._sr._base_path}\\misc\\variables\\menu_choices.json"
+        self._logo_menu_path: str = os.path.abspath(
+            os.path.join(self._sr._base_path, "misc", "ressources", "logo_menu.txt"))
+        self._menu_choices_path: str = os.path.abspath(
+            os.path.join(self._sr._base_path, "misc", "variables", "menu_choices.json"))
+        self._header: str = self._render_header()
         self._user_input: int
         self._rerun_as_admin = self._sr.rerun_as_admin
         self._dm: DownloadManager = DownloadManager(self._sr, self._page)
         self._config = self._dm.config
-        self._map = [
-            {
-                "1": self._dm.download_all,
-                "2": lambda: self._dm.download_sunshine(selective=True),
-                "3": lambda: self._dm.download_vdd(selective=True),
-                "4": lambda: self._dm.download_svm(selective=True),
-                "5": lambda: self._dm.download_playnite(selective=True),
-                "6": lambda: self._dm.download_playnite_watcher(selective=True),
-                "7": self._next_page,
-                "0": sys.exit
-            },
-            {
-                "1": lambda: self._dm.download_all(install=False),
-                "2": self._next_page,
-                "3": lambda: self._config.configure_sunshine(selective=True),
-                "4": lambda: self._sr.install_windows_display_manager(selective=True),
-                "5": self._config.open_sunshine_settings,
-                "6": self._config.open_playnite,
-                "7": self._previous_page,
-                "0": sys.exit
-            },
-            {
-                "1": lambda: self._dm.download_sunshine(install=False, selective=True),
-                "2": lambda: self._dm.download_vdd(install=False, selective=True),
-                "3": lambda: self._dm.download_svm(install=False, selective=True),
-                "4": lambda: self._dm.download_mmt(selective=True),
-                "5": lambda: self._dm.download_vsync_toggle(selective=True),
-                "6": lambda: self._dm.download_playnite(install=False, selective=True),
-                "7": lambda: self._dm.download_playnite_watcher(install=False, selective=True),
-                "8": self._previous_page,
-                "0": sys.exit
-            }
+        self._map: List[Tuple[Callable[[], None], ...]] = [
+            (
+                sys.exit,
+                self._dm.download_all,
+                lambda: self._dm.download_sunshine(selective=True),
+                lambda: self._dm.download_vdd(selective=True),
+                lambda: self._dm.download_svm(selective=True),
+                lambda: self._dm.download_playnite(selective=True),
+                lambda: self._dm.download_playnite_watcher(selective=True),
+                self._next_page
+            ),
+            (
+                sys.exit,
+                lambda: self._dm.download_all(install=False),
+                self._next_page,
+                lambda: self._config.configure_sunshine(selective=True),
+                lambda: self._sr.install_windows_display_manager(selective=True),
+                self._config.open_sunshine_settings,
+                self._config.open_playnite,
+                self._previous_page
+            ),
+            (
+                sys.exit,
+                lambda: self._dm.download_sunshine(install=False, selective=True),
+                lambda: self._dm.download_vdd(install=False, selective=True),
+                lambda: self._dm.download_svm(install=False, selective=True),
+                lambda: self._dm.download_mmt(selective=True),
+                lambda: self._dm.download_vsync_toggle(selective=True),
+                lambda: self._dm.download_playnite(install=False, selective=True),
+                lambda: self._dm.download_playnite_watcher(install=False, selective=True),
+                self._previous_page
+            )
         ]
 
         self._set_choices()
@@ -155,32 +160,36 @@ class MenuHandler:
     def map(self):
         raise ValueError("No manual edit allowed.")
 
-    def _print_logo(self) -> None:
+    def _render_header(self) -> str:
         with open(self._logo_menu_path, 'r') as logo_file:
-            lines = logo_file.readlines()
+            logo = "\n".join(line.rstrip() for line in logo_file)
 
-        for line in lines:
-            print(line.rstrip())
-
-    def _print_version(self) -> None:
-        print(f"{__version__}\n")
+        return f"{logo}\n{__version__}\n"
 
     def _set_choices(self) -> None:
-        with open(self._menu_choices_path, 'rb') as choices:
-            self._choices = json.loads(choices.read())
+        with open(self._menu_choices_path, 'r', encoding='utf-8') as choices:
+            self._choices = json.load(choices)
+        self._choices_numbers = [len(page) - 1 for page in self._choices]
         self._set_choices_number()
 
     def _set_choices_number(self) -> None:
-        self._choices_number = len(self._choices[self._page]) - 1
+        self._choices_number = self._choices_numbers[self._page]
+
+    def _render_page(self) -> str:
+        lines = ["\nMenu:"]
+        lines.extend(f"{number}. {choice}" for number, choice in self._choices[self._page].items())
+        return "\n".join(lines)
 
-    def _print_page(self) -> None:
-        print("\nMenu:")
-        for choice_number, choice in self._choices[self._page].items():
-            print(f"{choice_number}. {choice}")
+    def _print_frame(self) -> None:
+        print(f"{self._header}\n{self._render_page()}")
 
     def _get_user_input(self) -> bool:
+        raw_input = input(f"\nPlease choose an option (0-{self._choices_number}): ").strip()
+        if not raw_input:
+            return False
+
         try:
-            user_input = int(input(f"\nPlease choose an option (0-{self._choices_number}): "))
+            user_input = int(raw_input)
             if 0 <= user_input <= self._choices_number:
                 self._user_input = user_input
                 return True
@@ -198,7 +207,7 @@ class MenuHandler:
         self._set_choices_number()
 
     def _get_selection(self):
-        return self._map[self._page][str(self._user_input)]
+        return self._map[self._page][self._user_input]
 
     def _execute_selection(self):
         # Execute the method associated with the user_input
@@ -207,8 +216,6 @@ class MenuHandler:
     def print_menu(self):
         while True:
             self._sr.clear_screen()
-            self._print_logo()
-            self._print_version()
-            self._print_page()
+            self._print_frame()
             if self._get_user_input():
                 self._execute_selection()
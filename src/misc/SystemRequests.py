@@ -1,23 +1,33 @@
 import ctypes
 import glob
+import itertools
 import json
 import os
 import platform
 import shutil
+import stat
 import subprocess
 import sys
 import time
 import zipfile
 from misc.constants import *
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 
 class SystemRequests():
+    __slots__ = ("_all_configs", "_base_path", "_release", "_vt_enabled", "_wdm_installed")
 
     def __init__(self, base_path: str) -> None:
         self._all_configs: Dict[str, Dict[str, str]] = {}
         self._base_path = base_path
         self._release = self._get_platform_release()
+        self._vt_enabled = self._enable_virtual_terminal()
+        self._wdm_installed: bool = False
 
         self._set_config()
 
@@ -53,17 +63,23 @@ class SystemRequests():
             exit()
 
     def _set_config(self):
-        with open(f"{self._base_path}\\misc\\variables\\config.json", "rb") as config:
-            self._all_configs = json.loads(config.read())
+        with open(os.path.join(self._base_path, "misc", "variables", "config.json"), "r", encoding="utf-8") as config:
+            self._all_configs = json.load(config)
 
     def _check_module_installed(self) -> bool:
+        # Un module installé ne disparaît pas pendant la session
+        if self._wdm_installed:
+            return True
+
         command = f"Get-Module -ListAvailable -Name {MODULE_NAME}"
 
         try:
             result = subprocess.run(
-                ["powershell.exe", "-Command", command], capture_output=True, text=True)
+                ["powershell.exe", "-NoProfile", "-Command", command], capture_output=True, text=True,
+                creationflags=CREATE_NO_WINDOW)
 
             if result.stdout:
+                self._wdm_installed = True
                 return True
             else:
                 return False
@@ -74,27 +90,43 @@ class SystemRequests():
         if not os.path.isdir(folder):
             return
 
-        items = os.listdir(folder)
+        while True:
+            with os.scandir(folder) as it:
+                entries = list(itertools.islice(it, 2))
 
-        while len(items) == 1:
-            folder_path = os.path.join(folder, items[0])
-
-            if not os.path.isdir(folder_path):
+            if len(entries) != 1 or not entries[0].is_dir():
                 break
-            for item in os.listdir(folder_path):
-                item_path = os.path.join(folder_path, item)
+            folder_path = entries[0].path
+
+            with os.scandir(folder_path) as it:
+                children = list(it)
 
+            for entry in children:
                 try:
-                    shutil.move(item_path, folder)
-                except Exception as e:
-                    print(f"Error with moving {item_path}: {e}")
+                    os.replace(entry.path, os.path.join(folder, entry.name))
+                except OSError as e:
+                    print(f"Error with moving {entry.path}: {e}")
 
             try:
                 os.rmdir(folder_path)
             except OSError as e:
                 print(f"Error with deleting folder {folder_path}: {e}")
+                break
 
-            items = os.listdir(folder)
+    def _enable_virtual_terminal(self) -> bool:
+        try:
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+        except Exception:
+            return False
+
+    def _get_common_zip_prefix(self, members: List[zipfile.ZipInfo]) -> str:
+        prefix = os.path.commonprefix([member.filename for member in members])
+        return prefix[:prefix.rfind('/') + 1]
 
     def _get_platform_release(self):
         release = platform.release()
@@ -102,10 +134,25 @@ class SystemRequests():
 
     def pause(self):
         print()
-        os.system("pause")
+        # Pas d'utilisateur à attendre si l'entrée n'est pas un terminal
+        if sys.stdin is None or not sys.stdin.isatty():
+            return
+        if msvcrt is None:
+            os.system("pause")
+            return
+        print("Press any key to continue . . . ", end="", flush=True)
+        msvcrt.getch()
+        # Les touches étendues (flèches, F1...) envoient un second octet
+        while msvcrt.kbhit():
+            msvcrt.getch()
+        print()
 
     def clear_screen(self):
-        os.system('cls')
+        if not self._vt_enabled:
+            os.system('cls')
+            return
+        sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+        sys.stdout.flush()
 
     def rerun_as_admin(self):
         try:
@@ -128,12 +175,21 @@ class SystemRequests():
         if zip_file.endswith('.zip'):
             file_name = zip_file.rsplit('.', 1)[0]
 
-            if os.path.exists(file_name):
-                shutil.rmtree(file_name)
+            self.remove_tree(file_name)
 
             with zipfile.ZipFile(zip_file, 'r') as zip_ref:
                 print(f"\nExtracting {zip_file} to {file_name}")
-                zip_ref.extractall(file_name)
+                members = zip_ref.infolist()
+                prefix = self._get_common_zip_prefix(members)
+
+                if prefix:
+                    # Strip the shared top-level folders while extracting
+                    for member in members:
+                        member.filename = member.filename[len(prefix):]
+                        if member.filename:
+                            zip_ref.extract(member, file_name)
+                else:
+                    zip_ref.extractall(file_name)
             os.remove(zip_file)
             self._move_content_up(file_name)
         else:
@@ -141,25 +197,14 @@ class SystemRequests():
         return file_name
 
     def restart_sunshine_as_service(self, service_name) -> bool:
-        # Arrêter le service Sunshine
-        try:
-            print(f"\nStop Service {service_name}...")
-            subprocess.run(['sc', 'stop', service_name], check=True,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except subprocess.CalledProcessError as e:
-            print(f"\nError during the service shutdown {service_name}: {e}")
-            return False
-
-        # Attendre quelques secondes pour s'assurer que le service est complètement arrêté
-        time.sleep(2)
-
-        # Démarrer le service Sunshine
+        # Restart-Service attend que le service soit arrêté puis redémarré
         try:
-            print(f"\nStart Service {service_name}...")
-            subprocess.run(['sc', 'start', service_name], check=True,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            print(f"\nRestart Service {service_name}...")
+            subprocess.run(["powershell.exe", "-NoProfile", "-Command", f"Restart-Service -Name '{service_name}' -Force"],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           creationflags=CREATE_NO_WINDOW)
         except subprocess.CalledProcessError as e:
-            print(f"\nError during the start of service {service_name}: {e}")
+            print(f"\nError during the restart of service {service_name}: {e}")
             return False
 
         print(f"\n{service_name} has been successfully restarted.")
@@ -198,17 +243,13 @@ class SystemRequests():
         if batch_file_path:
             print("\nInstalling Virtual Display Driver certificat...")
             process = subprocess.Popen(['cmd.exe', '/c', batch_file_path], stdin=subprocess.PIPE,
-                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             process.communicate(b'\n')
 
         print("\nVirtual Display Driver certificat installed.")
 
     def find_file(self, pattern: str) -> str:
-        files = glob.glob(os.path.abspath(pattern))
-
-        if files:
-            return os.path.abspath(files[0])
-        return ""
+        return next(glob.iglob(os.path.abspath(pattern)), "")
 
     def find_word_in_file(self, file_path: str, search_terms: list):
         global_prep_cmd = []
@@ -232,12 +273,13 @@ class SystemRequests():
     def install_windows_display_manager(self, selective: bool = False):
         if not self._check_module_installed():
             try:
-                subprocess.run(["powershell.exe", "-Command",
-                                f"Install-Module -Name {MODULE_NAME}"], shell=True, check=True)
+                subprocess.run(["powershell.exe", "-NoProfile", "-Command",
+                                f"Install-Module -Name {MODULE_NAME}"], check=True)
             except:
                 print(
                     f"\nThe {MODULE_NAME} module was not installed due to an error.")
             else:
+                self._wdm_installed = True
                 print(f"\nThe {MODULE_NAME} module is now installed.")
         else:
             print(f"\nThe {MODULE_NAME} module is already installed.")
@@ -255,10 +297,23 @@ class SystemRequests():
         else:
             return "unsupported"
 
+    def _clear_readonly_and_retry(self, func, path, exc: BaseException):
+        # Rien à faire si l'élément a déjà disparu
+        if isinstance(exc, FileNotFoundError):
+            return
+        # Les fichiers en lecture seule bloquent la suppression sous Windows
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+
+    def remove_tree(self, path: str):
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=self._clear_readonly_and_retry)
+        else:
+            shutil.rmtree(path, onerror=lambda func, path, exc_info: self._clear_readonly_and_retry(func, path, exc_info[1]))
+
     def reset_tools_folder(self):
         self._delete_tools_folder()
         os.makedirs('tools', exist_ok=True)
 
     def _delete_tools_folder(self):
-        if os.path.exists('tools'):
-            shutil.rmtree('tools')
+        self.remove_tree('tools')
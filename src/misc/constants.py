@@ -1 +1,7 @@
 MODULE_NAME = "WindowsDisplayManager"
+YES_ANSWERS = frozenset(("y", "ye", "yes", ""))
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+CLEAR_SCREEN_SEQUENCE = "\x1b[2J\x1b[3J\x1b[H"
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+STD_OUTPUT_HANDLE = -11
+CREATE_NO_WINDOW = 0x08000000